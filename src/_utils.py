@@ -0,0 +1,196 @@
+import os
+import numpy as np
+from gurobipy import GRB
+from collections import deque
+
+
+def configure(model, no_rel_heur_time=0):
+    """
+    Sets the solver parameters shared by all community detection models.
+
+    Parameters:
+    - model: gurobipy.Model
+        Model to configure.
+    - no_rel_heur_time: float
+        Seconds of the no-relaxation heuristic before the root. It pays off on the
+        k-community models, whose relaxations are slow, but only delays the small
+        maximum community models, which keep the default of 0.
+    """
+    model.setParam("Presolve", 2)  # Aggressive presolve
+    model.setParam("MIPFocus", 1)  # Focus on finding feasible solutions
+    model.setParam("Threads", os.cpu_count())
+    model.setParam("NoRelHeurTime", no_rel_heur_time)
+    model.setParam("Method", 2)  # Barrier for the root relaxation
+
+
+def induced_components(S, nbrs):
+    """
+    Computes the connected components of the subgraph induced by S using BFS.
+
+    Parameters:
+    - S: iterable of int
+        Vertices inducing the subgraph.
+    - nbrs: list of list of int
+        Neighbor lists of the graph.
+
+    Returns:
+    - list: A list of components, each given as a list of vertices.
+    """
+    unvisited = set(S)
+    components = []
+    while unvisited:
+        start = unvisited.pop()
+        component = [start]
+        queue = deque([start])
+        while queue:
+            i = queue.popleft()
+            for j in nbrs[i]:
+                if j in unvisited:
+                    unvisited.remove(j)
+                    component.append(j)
+                    queue.append(j)
+        components.append(component)
+    return components
+
+
+def spectral_order(A):
+    """
+    Orders the vertices by the Fiedler vector of the graph Laplacian.
+
+    Parameters:
+    - A: numpy.ndarray
+        Adjacency matrix of the graph.
+
+    Returns:
+    - numpy.ndarray: The vertices, sorted by their Fiedler vector entry.
+    """
+    L = np.diag(A.sum(axis=1)) - A  # Graph Laplacian
+    _, eigvecs = np.linalg.eigh(L.astype(float))
+    return np.argsort(eigvecs[:, 1], kind="stable")
+
+
+def spectral_labels(order, k):
+    """
+    Splits a vertex ordering into k communities, used as a MIP start.
+
+    The ordered vertices are split into k consecutive blocks of nearly equal size, so
+    every block has at least 2 vertices whenever n >= 2*k. Communities are numbered in
+    order of their smallest vertex.
+
+    Parameters:
+    - order: numpy.ndarray
+        Vertex ordering, as returned by spectral_order.
+    - k: int
+        Number of communities.
+
+    Returns:
+    - numpy.ndarray: The community label in range(k) of every vertex.
+    """
+    n = len(order)
+    labels = np.empty(n, dtype=int)
+    labels[order] = np.arange(n) * k // n
+
+    # Relabel the communities in order of their smallest vertex, matching the symmetry breaking
+    _, first = np.unique(labels, return_index=True)
+    return np.argsort(np.argsort(first))[labels]
+
+
+def spectral_start(A, k):
+    """
+    Computes a heuristic partition of the vertices into k communities, used as a MIP start.
+
+    Vertices are sorted by spectral_order and split into blocks by spectral_labels.
+
+    Parameters:
+    - A: numpy.ndarray
+        Adjacency matrix of the graph.
+    - k: int
+        Number of communities.
+
+    Returns:
+    - numpy.ndarray: The community label in range(k) of every vertex.
+    """
+    return spectral_labels(spectral_order(A), k)
+
+
+def build_k_community_model(model, A_csr, k, sweep=False):
+    """
+    Adds the variables and constraints of the k-community model to a model.
+
+    With sweep=True, every community p has an activity variable z[p], and an unused
+    community is empty, which makes its proportional density constraints vacuous. The
+    number of communities is then fixed by a single counting constraint, so fewer
+    communities can be requested by changing its right-hand side instead of rebuilding
+    the model. Otherwise all k communities are used.
+
+    Parameters:
+    - model: gurobipy.Model
+        Model to build on.
+    - A_csr: scipy.sparse.csr_matrix
+        Adjacency matrix of the graph.
+    - k: int
+        Number of communities, or the maximum number of communities with sweep=True.
+    - sweep: bool
+        Whether to add the activity variables and the counting constraint.
+
+    Returns:
+    - tuple: The x, y and s variables, and the counting constraint sum_p z[p] == k
+      (None unless sweep=True).
+    """
+    n = A_csr.shape[0]  # Number of vertices
+    pairs = [(p, q) for p in range(k) for q in range(k) if p != q]  # Ordered pairs of distinct communities
+
+    # Variables, as matrices so that every constraint family is built by a few matrix
+    # operations in gurobipy instead of Python loops over vertices.
+    # Symmetry breaking: communities are numbered in order of their smallest vertex, so
+    # vertex i can only lie in communities 0, ..., i.
+    x_ub = (np.arange(k)[None, :] <= np.arange(n)[:, None]).astype(float)
+    x = model.addMVar((n, k), vtype=GRB.BINARY, ub=x_ub, name="x")  # Vertex-to-community assignment
+    y_ub = np.full((n, k, k), float(n))
+    y_ub[:, range(k), range(k)] = 0  # y[:, p, p] is not used
+    y = model.addMVar((n, k, k), vtype=GRB.INTEGER, lb=0, ub=y_ub, name="y")  # y[j, p, q] = x[j, p] * |C_q|
+    s = model.addMVar(k, vtype=GRB.INTEGER, lb=0, ub=n, name="s")  # s[p] = |C_p|
+
+    # Constraints
+
+    for p, q in pairs:
+        # 1. Proportional density constraint using indicator constraints, for all i at once
+        #    |N(i) ∩ C_p| * |C_q| >= |N(i) ∩ C_q| * (|C_p| - 1) for every i in C_p
+        N_C = A_csr @ y[:, p, q]  # |N(i) ∩ C_p| * |C_q|
+        N_Cprime = A_csr @ y[:, q, p]  # |N(i) ∩ C_q| * |C_p|
+        correction = A_csr @ x[:, q]  # |N(i) ∩ C_q|
+        model.addGenConstrIndicator(x[:, p], True, N_C >= N_Cprime - correction)
+
+        # 2. Link y to x: y[j, p, q] = s[q] if x[j, p] = 1, and 0 otherwise
+        model.addConstr(y[:, p, q] <= n * x[:, p])
+        model.addConstr(y[:, p, q] <= s[q])
+        model.addGenConstrIndicator(x[:, p], True, y[:, p, q] >= s[q])  # Instead of a big-M row
+
+    # 3. Community sizes, with at least two vertices in each used community and none in an unused one
+    model.addConstr(s == x.sum(axis=0), name="communitySizes")
+    if sweep:
+        z = model.addMVar(k, vtype=GRB.BINARY, name="z")  # 1 if community p is used
+        model.addConstr(s >= 2 * z, name="atLeastTwoinCi")
+        model.addConstr(s <= n * z, name="emptyIfUnused")
+    else:
+        model.addConstr(s >= 2, name="atLeastTwoinCi")
+
+    # 4. Every vertex belongs to exactly one community
+    model.addConstr(x.sum(axis=1) == 1, name="everyvertexbelongsto1community")
+
+    # 5. Symmetry breaking, continued: vertex i can only lie in community p if some earlier
+    #    vertex lies in community p - 1
+    #    c[i, p] = |{j < i : j in C_p}| is kept as a running sum, so this takes O(n*k) nonzeros
+    c_ub = np.repeat(np.arange(n, dtype=float)[:, None], k - 1, axis=1)  # c[0, :] = 0
+    c = model.addMVar((n, k - 1), lb=0, ub=c_ub, name="c")
+    model.addConstr(c[1:, :] == c[:-1, :] + x[:-1, :-1], name="earlierCount")
+    model.addConstr(x[:, 1:] <= c, name="earlierVertexInPreviousCommunity")
+
+    # 6. The unused communities come last, and the number of used communities is adjusted
+    #    through the right-hand side before each solve
+    count = None
+    if sweep:
+        model.addConstr(z[:-1] >= z[1:], name="usedCommunitiesFirst")
+        count = model.addConstr(z.sum() == k, name="numberOfCommunities")
+
+    return x, y, s, count
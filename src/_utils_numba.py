@@ -0,0 +1,22 @@
+from numba import njit, prange
+
+
+@njit(parallel=True, cache=True)
+def is_symmetric(A):
+    """
+    Checks whether a square matrix is symmetric.
+
+    Parameters:
+    - A: numpy.ndarray
+        Square matrix to check.
+
+    Returns:
+    - bool: True if A[i, j] == A[j, i] for all i and j.
+    """
+    mismatches = 0
+    for i in prange(A.shape[0]):
+        for j in range(i):
+            if A[i, j] != A[j, i]:
+                mismatches += 1
+    return mismatches == 0
+
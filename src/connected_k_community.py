@@ -1,5 +1,10 @@
 import numpy as np
-from gurobipy import Model, GRB, quicksum
+from gurobipy import Model, GRB
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
+from ._utils import build_k_community_model, configure, induced_components, spectral_start
+from ._utils_numba import is_symmetric
+
 
 def find_connected_k_community(A, k):
     """
@@ -15,8 +20,9 @@ def find_connected_k_community(A, k):
     - dict: A dictionary of communities if feasible.
     - str: A message if no connected k-community exists.
     """
+    A = np.ascontiguousarray(A, dtype=np.int8)  # Compact 0/1 storage, and a single dtype for is_symmetric
     assert A.shape[0] == A.shape[1], "Adjacency matrix must be square."
-    assert (A == A.T).all(), "Adjacency matrix must be symmetric."
+    assert is_symmetric(A), "Adjacency matrix must be symmetric."
 
     n = A.shape[0]  # Number of vertices
 
@@ -27,78 +33,57 @@ def find_connected_k_community(A, k):
     if k < 2:
         return "k must be at least 2."
 
+    # Every community lies inside one component of the graph and an isolated vertex
+    # cannot join a connected community of size at least 2
+    A_csr = csr_matrix(A)  # Sparse rows: neighbor lists and products cost O(|E|) instead of O(n²)
+    n_components, component_labels = connected_components(A_csr, directed=False)
+    if n_components > k or np.bincount(component_labels).min() < 2:
+        return f"No connected {k}-community exists."
+
     V = range(n)
 
+    # Neighbor lists, copied out of the CSR index array as Python lists
+    nbrs = [A_csr.indices[A_csr.indptr[i]:A_csr.indptr[i + 1]].tolist() for i in V]  # Plain ints for the BFS and the cuts
+
     # Initialize Gurobi model
     model = Model("connected_k_community")
-
-    # Variables
-    x = model.addVars(V, range(k), vtype=GRB.BINARY, name="x")  # Vertex-to-community assignment
-    w = model.addVars(V, V, range(k), range(k), vtype=GRB.BINARY, name="w")  # Interaction variables
-    f = model.addVars(V, V, range(k), vtype=GRB.CONTINUOUS, lb=0, name="f")  # Flow variables
-
-    # Constraints
-
-    # 1. Proportional density constraint using indicator constraints
-    for i in V:
+    configure(model, no_rel_heur_time=5)
+    model.setParam("LazyConstraints", 1)  # Connectivity cuts are added in a callback
+
+    # The k-community model, with all k communities used
+    x, y, s, _ = build_k_community_model(model, A_csr, k)
+
+    # Connectivity constraints, separated lazily on every new incumbent.
+    # If C_p induces several components, then for a component K, a vertex u in K and a
+    # vertex v outside K, every u-v path leaves K through N(K) \ K, none of which is in C_p.
+    def connectivity_callback(model, where):
+        if where != GRB.Callback.MIPSOL:
+            return
+        x_val = model.cbGetSolution(x)
         for p in range(k):
-            for q in range(k):
-                if p != q:
-                    N_C = quicksum(A[i, j1] * quicksum(w[j1, j2, p, q] for j2 in V) for j1 in V)
-                    N_Cprime = quicksum(A[i, l1] * quicksum(w[l1, l2, q, p] for l2 in V) for l1 in V)
-                    correction = quicksum(x[l, q] * A[i, l] for l in V)
-                    
-                    # Use an indicator constraint for conditional enforcement
-                    model.addGenConstrIndicator(
-                        x[i, p], 1,  # Enforce this constraint only if x[i, p] = 1
-                        N_C >= N_Cprime - correction,
-                        name=f"CpwrtCq_{i}_{p}_{q}"
-                    )
-
-    # 2. Link w to x
-    for j1 in V:
-        for j2 in V:
-            for p in range(k):
-                for q in range(k):
-                    model.addConstr(w[j1, j2, p, q] <= x[j1, p], name=f"WlinkedtoX1_{j1}_{j2}_{p}_{q}")
-                    model.addConstr(w[j1, j2, p, q] <= x[j2, q], name=f"WlinkedtoX2_{j1}_{j2}_{p}_{q}")
-                    model.addConstr(w[j1, j2, p, q] >= x[j1, p] + x[j2, q] - 1, name=f"WlinkedtoX3_{j1}_{j2}_{p}_{q}")
-
-    # 3. At least two vertices in each community
-    for p in range(k):
-        model.addConstr(quicksum(x[i, p] for i in V) >= 2, name=f"atLeastTwoinCi_{p}")
-
-    # 4. Every vertex belongs to exactly one community
-    for i in V:
-        model.addConstr(quicksum(x[i, p] for p in range(k)) == 1, name=f"everyvertexbelongsto1community_{i}")
-
-    # 5. Connectivity constraints using flow
-    for p in range(k):
-        root = 0  # Assume vertex 0 is the root for all communities
-        model.addConstr(x[root, p] == 1, name=f"root_in_community_{p}")  # Root must belong to the community
-
-        # Flow conservation and capacity constraints
-        for i in V:
-            if i != root:
-                model.addConstr(
-                    quicksum(f[j, i, p] for j in V if A[j, i] == 1) ==
-                    quicksum(f[i, j, p] for j in V if A[i, j] == 1),
-                    name=f"flow_conservation_{i}_{p}"
-                )
-
-        # Ensure flow can only pass between vertices in the same community
-        for i in V:
-            for j in V:
-                if A[i, j] == 1:
-                    model.addConstr(f[i, j, p] <= x[i, p], name=f"flow_capacity_start_{i}_{j}_{p}")
-                    model.addConstr(f[i, j, p] <= x[j, p], name=f"flow_capacity_end_{i}_{j}_{p}")
+            components = induced_components(np.flatnonzero(x_val[:, p] > 0.5), nbrs)
+            if len(components) < 2:
+                continue
+            for K, other in zip(components, components[1:] + components[:1]):
+                in_K = set(K)
+                separator = sorted({j for i in K for j in nbrs[i] if j not in in_K})
+                model.cbLazy(x[K[0], p] + x[other[0], p] - x[separator, p].sum() <= 1)
+
+    # MIP start from a spectral partition of the graph
+    labels = spectral_start(A, k)
+    x_start = np.zeros((n, k))
+    x_start[np.arange(n), labels] = 1.0
+    x.Start = x_start
+    y.Start = x_start[:, :, None] * x_start.sum(axis=0)[None, None, :] * (1 - np.eye(k))
+    s.Start = x_start.sum(axis=0)
 
     # Optimize the model
-    model.optimize()
+    model.optimize(connectivity_callback)
 
     if model.status == GRB.INFEASIBLE:
         return f"No connected {k}-community exists."
     else:
         # Extract results
-        communities = {p + 1: [i for i in V if x[i, p].X > 0.5] for p in range(k)}
+        x_val = x.X
+        communities = {p + 1: [i for i in V if x_val[i, p] > 0.5] for p in range(k)}
         return communities
@@ -1,5 +1,10 @@
 import numpy as np
 from gurobipy import Model, GRB, quicksum
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
+from ._utils import configure, induced_components
+from ._utils_numba import is_symmetric
+
 
 def find_connected_max_community(A):
     """
@@ -17,65 +22,80 @@ def find_connected_max_community(A):
     """
     
     # Input validation
+    A = np.ascontiguousarray(A, dtype=np.int8)  # Compact 0/1 storage, and a single dtype for is_symmetric
     assert A.shape[0] == A.shape[1], "Adjacency matrix must be square."
-    assert (A == A.T).all(), "Adjacency matrix must be symmetric."
+    assert is_symmetric(A), "Adjacency matrix must be symmetric."
 
     n = A.shape[0]  # Number of vertices
     if n < 3:
         return "Graph has less than 3 vertices."
 
+    # A connected community with at least 2 vertices needs a component with an edge
+    A_csr = csr_matrix(A)  # Sparse rows: neighbor lists and products cost O(|E|) instead of O(n²)
+    n_components, labels = connected_components(A_csr, directed=False)
+    component_sizes = np.bincount(labels)
+    if component_sizes.max() < 2:
+        return "No connected community exists."
+
     V = range(n)
 
-    # Precompute degrees
-    d = np.sum(A, axis=1)
+    # Precompute degrees and neighbor lists
+    d = np.sum(A, axis=1) - np.diagonal(A)  # Self-loops do not count towards the degree
+    nbrs = [A_csr.indices[A_csr.indptr[i]:A_csr.indptr[i + 1]].tolist() for i in V]  # Plain ints for the BFS and the cuts
 
     # Create the Gurobi model
     model = Model("Connected_Max_Community")
+    configure(model)
     model.setParam("OutputFlag", 1)
+    model.setParam("LazyConstraints", 1)  # Connectivity cuts are added in a callback
 
     # Variables
-    x = model.addVars(V, vtype=GRB.BINARY, name="x")  # 1 if vertex is in S
-    f = model.addVars(V, V, vtype=GRB.CONTINUOUS, lb=0, name="f")  # Flow variables
+    xvec = model.addMVar(n, vtype=GRB.BINARY, name="x")  # 1 if vertex is in S
+    x = xvec.tolist()  # Per-vertex views of xvec
+
+    S_size = xvec.sum()  # Size of S, shared by the objective and all constraints
 
     # Objective: Maximize the size of S
-    model.setObjective(quicksum(x[i] for i in V), GRB.MAXIMIZE)
+    model.setObjective(S_size, GRB.MAXIMIZE)
 
     # Constraints
-    model.addConstr(quicksum(x[i] for i in V) >= 2, name="min_size_S")  # S has at least 2 vertices
-    model.addConstr(quicksum(x[i] for i in V) <= n - 1, name="max_size_S")  # S excludes at least one vertex
-
-    # Connectivity constraints
-    root = 0
-    model.addConstr(x[root] == 1, name="root_in_community")
-    for i in V:
-        if i != root:
-            model.addConstr(
-                quicksum(f[j, i] for j in V if A[j, i] == 1) ==
-                quicksum(f[i, j] for j in V if A[i, j] == 1),
-                name=f"flow_conservation_{i}"
-            )
-    for i in V:
-        for j in V:
-            if A[i, j] == 1:
-                model.addConstr(f[i, j] <= x[i], name=f"flow_capacity_start_{i}_{j}")
-                model.addConstr(f[i, j] <= x[j], name=f"flow_capacity_end_{i}_{j}")
+    model.addConstr(S_size >= 2, name="min_size_S")  # S has at least 2 vertices
+    model.addConstr(S_size <= n - 1, name="max_size_S")  # S excludes at least one vertex
+    model.addConstr(S_size <= component_sizes.max(), name="max_size_component")  # A connected S fits in one component
 
     # Community constraints
-    for u in V:
-        d_S = quicksum(A[u, v] * x[v] for v in V if u != v)
-        d_not_S = quicksum(A[u, v] * (1 - x[v]) for v in V if u != v)
-        S_size = quicksum(x[v] for v in V)
-        complement_size = n - S_size
-
-        # Enforce the proportional density inequality only if x[u] = 1
-        model.addGenConstrIndicator(
-            x[u], 1,  # Activate this constraint when x[u] = 1
-            d_S * complement_size >= d_not_S * (S_size - 1),
-            name=f"pds_constraint_{u}"
-        )
+    # Every u in S must satisfy d_S / (|S| - 1) >= d_not_S / (n - |S|). Substituting
+    # d_not_S = d[u] - d_S turns the cross-multiplied inequality into the linear
+    # (n - 1) * d_S >= d[u] * (|S| - 1).
+    d_S = A_csr @ xvec - np.diagonal(A) * xvec  # d_S[u] for every u, as one matrix-vector product
+
+    # Enforce the proportional density inequality for u only if x[u] = 1, for all u at once
+    model.addGenConstrIndicator(xvec, True, (n - 1) * d_S >= (S_size - 1) * d)
+
+    # Connectivity constraints, separated lazily on every new incumbent.
+    # If S induces several components, then for a component K, a vertex u in K and a
+    # vertex v outside K, every u-v path leaves K through N(K) \ K, none of which is in S.
+    def connectivity_callback(model, where):
+        if where != GRB.Callback.MIPSOL:
+            return
+        x_val = model.cbGetSolution(x)
+        components = induced_components((i for i in V if x_val[i] > 0.5), nbrs)
+        if len(components) < 2:
+            return
+        for K, other in zip(components, components[1:] + components[:1]):
+            in_K = set(K)
+            separator = {j for i in K for j in nbrs[i] if j not in in_K}
+            model.cbLazy(x[K[0]] + x[other[0]] - quicksum(x[s] for s in separator) <= 1)
+
+    # MIP start: the largest component, minus a minimum-degree vertex if it spans the graph
+    start = labels == component_sizes.argmax()
+    if start.all():
+        start[np.argmin(d)] = False
+    for i in V:
+        x[i].Start = 1.0 if start[i] else 0.0
 
     # Solve the model
-    model.optimize()
+    model.optimize(connectivity_callback)
 
     # Extract results
     if model.status == GRB.OPTIMAL:
@@ -1,6 +1,10 @@
 import numpy as np
-from gurobipy import Model, GRB, quicksum
+from gurobipy import Model, GRB
+from scipy.sparse import csr_matrix
 from collections import defaultdict, deque
+from ._utils import build_k_community_model, configure, spectral_labels, spectral_order
+from ._utils_numba import is_symmetric
+
 
 def find_k_community(A, k):
     """
@@ -16,68 +20,70 @@ def find_k_community(A, k):
     - dict: A dictionary of communities if feasible.
     - str: A message if no k-community exists.
     """
+    return find_k_community_sweep(A, [k])[k]
+
+
+def find_k_community_sweep(A, ks):
+    """
+    Finds k-community structures in a graph for several numbers of communities.
+
+    A single model is built for the largest valid k and reused for the smaller ones.
+
+    Parameters:
+    - A: numpy.ndarray
+        Adjacency matrix of the graph.
+    - ks: list of int
+        Numbers of communities to try.
+
+    Returns:
+    - dict: For every k in ks, the result of find_k_community(A, k).
+    """
+    A = np.ascontiguousarray(A, dtype=np.int8)  # Compact 0/1 storage, and a single dtype for is_symmetric
     assert A.shape[0] == A.shape[1], "Adjacency matrix must be square."
-    assert (A == A.T).all(), "Adjacency matrix must be symmetric."
+    assert is_symmetric(A), "Adjacency matrix must be symmetric."
 
     n = A.shape[0]  # Number of vertices
 
-    if n < 4:
-        return "The graph has less than 4 vertices."
-    if n < 2 * k:
-        return "The number of vertices must be at least 2*k."
-    if k < 2:
-        return "k must be at least 2."
-    
-    V = range(n)
-
-    # Initialize Gurobi model
-    model = Model("k_community")
-
-    # Variables
-    x = model.addVars(V, range(k), vtype=GRB.BINARY, name="x")  # Vertex-to-community assignment
-    w = model.addVars(V, V, range(k), range(k), vtype=GRB.BINARY, name="w")  # Interaction variables
-
-    # Constraints
-
-    # 1. Proportional density constraint using indicator constraints
-    for i in V:
-        for p in range(k):
-            for q in range(k):
-                if p != q:
-                    N_C = quicksum(A[i, j1] * quicksum(w[j1, j2, p, q] for j2 in V) for j1 in V)
-                    N_Cprime = quicksum(A[i, l1] * quicksum(w[l1, l2, q, p] for l2 in V) for l1 in V)
-                    correction = quicksum(x[l, q] * A[i, l] for l in V)
-                    
-                    # Use an indicator constraint for conditional enforcement
-                    model.addGenConstrIndicator(
-                        x[i, p], 1,  # Enforce this constraint only if x[i, p] = 1
-                        N_C >= N_Cprime - correction,
-                        name=f"CpwrtCq_{i}_{p}_{q}"
-                    )
-
-    # 2. Link w to x
-    for j1 in V:
-        for j2 in V:
-            for p in range(k):
-                for q in range(k):
-                    model.addConstr(w[j1, j2, p, q] <= x[j1, p], name=f"WlinkedtoX1_{j1}_{j2}_{p}_{q}")
-                    model.addConstr(w[j1, j2, p, q] <= x[j2, q], name=f"WlinkedtoX2_{j1}_{j2}_{p}_{q}")
-                    model.addConstr(w[j1, j2, p, q] >= x[j1, p] + x[j2, q] - 1, name=f"WlinkedtoX3_{j1}_{j2}_{p}_{q}")
-
-    # 3. At least two vertices in each community
-    for p in range(k):
-        model.addConstr(quicksum(x[i, p] for i in V) >= 2, name=f"atLeastTwoinCi_{p}")
-
-    # 4. Every vertex belongs to exactly one community
-    for i in V:
-        model.addConstr(quicksum(x[i, p] for p in range(k)) == 1, name=f"everyvertexbelongsto1community_{i}")
-
-    # Optimize the model
-    model.optimize()
-
-    if model.status == GRB.INFEASIBLE:
-        return f"No {k}-community exists."
-    else:
-        # Extract results
-        communities = {p + 1: [i for i in V if x[i, p].X > 0.5] for p in range(k)}
-        return communities
+    results = {}
+    for k in ks:
+        if n < 4:
+            results[k] = "The graph has less than 4 vertices."
+        elif n < 2 * k:
+            results[k] = "The number of vertices must be at least 2*k."
+        elif k < 2:
+            results[k] = "k must be at least 2."
+
+    candidates = sorted(set(ks) - set(results))
+    if candidates:
+        V = range(n)
+        k_max = candidates[-1]
+
+        # Initialize Gurobi model with room for the largest k
+        model = Model("k_community")
+        configure(model, no_rel_heur_time=5)
+        x, y, s, count = build_k_community_model(model, csr_matrix(A), k_max, sweep=True)  # Sparse rows: products cost O(|E|)
+
+        order = spectral_order(A)  # The Fiedler ordering does not depend on k
+
+        for k in candidates:
+            count.RHS = k
+
+            # MIP start from a spectral partition of the graph
+            labels = spectral_labels(order, k)
+            x_start = np.zeros((n, k_max))
+            x_start[np.arange(n), labels] = 1.0
+            x.Start = x_start
+            y.Start = x_start[:, :, None] * x_start.sum(axis=0)[None, None, :] * (1 - np.eye(k_max))
+            s.Start = x_start.sum(axis=0)
+
+            # Optimize the model
+            model.optimize()
+
+            if model.status == GRB.INFEASIBLE:
+                results[k] = f"No {k}-community exists."
+            else:
+                # Extract results
+                x_val = x.X
+                results[k] = {p + 1: [i for i in V if x_val[i, p] > 0.5] for p in range(k)}
+
+    return {k: results[k] for k in ks}
@@ -1,5 +1,10 @@
 import numpy as np
-from gurobipy import Model, GRB, quicksum
+from gurobipy import Model, GRB
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
+from ._utils import configure
+from ._utils_numba import is_symmetric
+
 
 def find_max_community(A):
     """
@@ -16,8 +21,9 @@ def find_max_community(A):
     - str: If the graph has fewer than 3 vertices or if no PDS is found, returns an appropriate message.
     """
     # Input validation
+    A = np.ascontiguousarray(A, dtype=np.int8)  # Compact 0/1 storage, and a single dtype for is_symmetric
     assert A.shape[0] == A.shape[1], "Adjacency matrix must be square."
-    assert (A == A.T).all(), "Adjacency matrix must be symmetric."
+    assert is_symmetric(A), "Adjacency matrix must be symmetric."
 
     n = A.shape[0]  # Number of vertices
 
@@ -26,34 +32,44 @@ def find_max_community(A):
 
     V = range(n)
 
+    # Precompute degrees and connected components
+    d = np.sum(A, axis=1) - np.diagonal(A)  # Self-loops do not count towards the degree
+    A_csr = csr_matrix(A)  # Sparse rows: products cost O(|E|) instead of O(n²)
+    _, labels = connected_components(A_csr, directed=False)
+
     # Create the Gurobi model
     model = Model("MaxCommunity")
-    model.setParam("Threads", 4) 
+    configure(model)
 
     # Variables: x[i] = 1 if vertex i is in S, 0 otherwise
-    x = model.addVars(V, vtype=GRB.BINARY, name="x")
+    xvec = model.addMVar(n, vtype=GRB.BINARY, name="x")
+    x = xvec.tolist()  # Per-vertex views of xvec
+
+    S_size = xvec.sum()  # Size of S, shared by the objective and all constraints
 
     # Objective: Maximize the size of S
-    model.setObjective(quicksum(x[i] for i in V), GRB.MAXIMIZE)
+    model.setObjective(S_size, GRB.MAXIMIZE)
 
     # Constraints on the size of S
-    model.addConstr(quicksum(x[i] for i in V) >= 2, name="min_size_S")  # S must have at least 2 vertices
-    model.addConstr(quicksum(x[i] for i in V) <= n - 1, name="max_size_S")  # S must exclude at least one vertex
+    model.addConstr(S_size >= 2, name="min_size_S")  # S must have at least 2 vertices
+    model.addConstr(S_size <= n - 1, name="max_size_S")  # S must exclude at least one vertex
 
     # Community constraints
-    for u in V:
-        d_S = quicksum(A[u, v] * x[v] for v in V if u != v)
-        d_not_S = quicksum(A[u, v] * (1 - x[v]) for v in V if u != v)
-        S_size = quicksum(x[v] for v in V)
-        complement_size = n - S_size
-
-        # Enforce the proportional density inequality only if x[u] = 1
-        model.addGenConstrIndicator(
-            x[u], 1,  # Activate this constraint when x[u] = 1
-            d_S * complement_size >= d_not_S * (S_size - 1),
-            name=f"pds_constraint_{u}"
-        )
+    # Every u in S must satisfy d_S / (|S| - 1) >= d_not_S / (n - |S|). Substituting
+    # d_not_S = d[u] - d_S turns the cross-multiplied inequality into the linear
+    # (n - 1) * d_S >= d[u] * (|S| - 1).
+    d_S = A_csr @ xvec - np.diagonal(A) * xvec  # d_S[u] for every u, as one matrix-vector product
+
+    # Enforce the proportional density inequality for u only if x[u] = 1, for all u at once
+    model.addGenConstrIndicator(xvec, True, (n - 1) * d_S >= (S_size - 1) * d)
+
 
+    # MIP start: the largest component, minus a minimum-degree vertex if it spans the graph
+    start = labels == np.bincount(labels).argmax()
+    if start.all():
+        start[np.argmin(d)] = False
+    for i in V:
+        x[i].Start = 1.0 if start[i] else 0.0
 
     # Solve the model
     model.optimize()
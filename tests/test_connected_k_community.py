@@ -1,9 +1,19 @@
 import unittest
+from unittest import mock
 import numpy as np
-from connected_k_community import find_connected_k_community
+from scipy.sparse.csgraph import connected_components
+from src.connected_k_community import find_connected_k_community
 
 class TestConnectedKCommunity(unittest.TestCase):
 
+    def assertCommunitiesConnected(self, A, result):
+        """
+        Assert that every community induces a connected subgraph of A.
+        """
+        for community in result.values():
+            n_components, _ = connected_components(A[np.ix_(community, community)], directed=False)
+            self.assertEqual(n_components, 1, f"Community {community} is not connected.")
+
     def test_small_connected_graph(self):
         """
         Test a small fully connected graph with k = 2 communities.
@@ -62,6 +72,61 @@ class TestConnectedKCommunity(unittest.TestCase):
         self.assertIsInstance(result, dict)
         self.assertEqual(len(result), 1)
 
+    def test_cycle_with_tail(self):
+        """
+        Test a 4-cycle with a path of 3 vertices attached, where a 2-community without
+        the connectivity requirement may pair vertices from both sides.
+        """
+        A = np.array([
+            [0, 0, 0, 1, 0, 0, 1],
+            [0, 0, 0, 0, 0, 1, 0],
+            [0, 0, 0, 1, 0, 1, 0],
+            [1, 0, 1, 0, 1, 0, 0],
+            [0, 0, 0, 1, 0, 0, 1],
+            [0, 1, 1, 0, 0, 0, 0],
+            [1, 0, 0, 0, 1, 0, 0]
+        ])
+        k = 2
+        result = find_connected_k_community(A, k)
+        self.assertIsInstance(result, dict)
+        self.assertEqual(len(result), k)
+        self.assertCommunitiesConnected(A, result)
+
+    def test_path_graph(self):
+        """
+        Test a path on 8 vertices with k = 3 communities.
+        """
+        n = 8
+        A = np.eye(n, k=1, dtype=int) + np.eye(n, k=-1, dtype=int)
+        k = 3
+        result = find_connected_k_community(A, k)
+        self.assertIsInstance(result, dict)
+        self.assertEqual(len(result), k)
+        self.assertCommunitiesConnected(A, result)
+
+    def test_more_components_than_k(self):
+        """
+        Test three disjoint edges with k = 2, which is rejected before any model is built.
+        """
+        A = np.kron(np.eye(3, dtype=int), np.array([[0, 1], [1, 0]]))
+        k = 2
+        with mock.patch("src.connected_k_community.Model") as model:
+            result = find_connected_k_community(A, k)
+        model.assert_not_called()
+        self.assertEqual(result, "No connected 2-community exists.")
+
+    def test_isolated_vertex(self):
+        """
+        Test a 5-clique with an isolated vertex and k = 2, which is rejected before any model is built.
+        """
+        A = np.ones((6, 6), dtype=int) - np.eye(6, dtype=int)
+        A[5, :] = A[:, 5] = 0
+        k = 2
+        with mock.patch("src.connected_k_community.Model") as model:
+            result = find_connected_k_community(A, k)
+        model.assert_not_called()
+        self.assertEqual(result, "No connected 2-community exists.")
+
     def test_invalid_input_non_square(self):
         """
         Test with a non-square adjacency matrix.
@@ -1,9 +1,18 @@
 import unittest
+from unittest import mock
 import numpy as np
-from connected_max_community import find_connected_max_community
+from scipy.sparse.csgraph import connected_components
+from src.connected_max_community import find_connected_max_community
 
 class TestFindConnectedMaxCommunity(unittest.TestCase):
 
+    def assertCommunityConnected(self, A, community):
+        """
+        Assert that the community induces a connected subgraph of A.
+        """
+        n_components, _ = connected_components(A[np.ix_(community, community)], directed=False)
+        self.assertEqual(n_components, 1, f"Community {community} is not connected.")
+
     def test_fully_connected_graph(self):
         """
         Test a fully connected graph.
@@ -58,6 +67,41 @@ class TestFindConnectedMaxCommunity(unittest.TestCase):
         self.assertIsInstance(result, str)
         self.assertEqual(result, "Graph has less than 3 vertices.")
 
+    def test_blocks_joined_through_vertex(self):
+        """
+        Test two 4-cliques joined through a vertex adjacent to one vertex of each. Without
+        the connectivity requirement the largest PDS is two disjoint triangles of size 6.
+        """
+        A = np.zeros((9, 9), dtype=int)
+        A[1:5, 1:5] = 1
+        A[5:9, 5:9] = 1
+        np.fill_diagonal(A, 0)
+        A[0, [1, 5]] = A[[1, 5], 0] = 1
+        result = find_connected_max_community(A)
+        self.assertIsInstance(result, dict)
+        self.assertEqual(result["size"], 5)
+        self.assertCommunityConnected(A, result["community"])
+
+    def test_path_graph(self):
+        """
+        Test a path on 7 vertices.
+        """
+        n = 7
+        A = np.eye(n, k=1, dtype=int) + np.eye(n, k=-1, dtype=int)
+        result = find_connected_max_community(A)
+        self.assertIsInstance(result, dict)
+        self.assertCommunityConnected(A, result["community"])
+
+    def test_edgeless_graph(self):
+        """
+        Test a graph without edges, which is rejected before any model is built.
+        """
+        A = np.zeros((5, 5), dtype=int)
+        with mock.patch("src.connected_max_community.Model") as model:
+            result = find_connected_max_community(A)
+        model.assert_not_called()
+        self.assertEqual(result, "No connected community exists.")
+
     def test_invalid_input_non_square(self):
         """
         Test with a non-square adjacency matrix.
@@ -1,9 +1,24 @@
 import unittest
 import numpy as np
-from k_community import find_k_community 
+from src.k_community import find_k_community, find_k_community_sweep
 
 class TestKCommunity(unittest.TestCase):
 
+    def assertKCommunity(self, A, communities, k):
+        """
+        Assert that communities partitions the vertices of A into k communities of at least
+        2 vertices with |N(i) ∩ C_p| * |C_q| >= |N(i) ∩ C_q| * (|C_p| - 1) for every i in C_p.
+        """
+        self.assertEqual(len(communities), k)
+        self.assertEqual(sorted(i for C in communities.values() for i in C), list(range(A.shape[0])))
+        for C_p in communities.values():
+            self.assertGreaterEqual(len(C_p), 2)
+            for C_q in communities.values():
+                if C_q is C_p:
+                    continue
+                for i in C_p:
+                    self.assertGreaterEqual(A[i, C_p].sum() * len(C_q), A[i, C_q].sum() * (len(C_p) - 1))
+
     def test_small_fully_connected_graph(self):
         """
         Test a small fully connected graph with k = 2 communities.
@@ -102,5 +117,22 @@ class TestKCommunity(unittest.TestCase):
         self.assertIsInstance(result, dict)
         self.assertEqual(len(result), k)
 
+    def test_k_sweep(self):
+        """
+        Test that a k-sweep reusing one model agrees with separate solves.
+        """
+        np.random.seed(42)
+        n = 10
+        A = np.random.randint(0, 2, (n, n))
+        A = np.triu(A, 1)  # Ensure no self-loops and upper triangular matrix
+        A += A.T  # Make the adjacency matrix symmetric
+        results = find_k_community_sweep(A, [1, 2, 3])
+        self.assertEqual(list(results), [1, 2, 3])
+        for k in [1, 2, 3]:
+            result = find_k_community(A, k)
+            self.assertIsInstance(results[k], type(result))
+            if isinstance(result, dict):
+                self.assertKCommunity(A, results[k], k)
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 import numpy as np
-from max_community import find_max_community 
+from src.max_community import find_max_community 
 
 class TestFindMaxCommunity(unittest.TestCase):
 
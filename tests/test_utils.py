@@ -0,0 +1,31 @@
+import unittest
+import numpy as np
+from src._utils import induced_components, spectral_start
+
+class TestUtils(unittest.TestCase):
+
+    def test_induced_components(self):
+        """
+        Test that removing the middle vertex of a path splits it into two components.
+        """
+        nbrs = [[1], [0, 2], [1, 3], [2, 4], [3]]
+        components = induced_components([0, 1, 3, 4], nbrs)
+        self.assertEqual(sorted(sorted(c) for c in components), [[0, 1], [3, 4]])
+
+    def test_spectral_start(self):
+        """
+        Test that two triangles joined by an edge are split into the two triangles.
+        """
+        A = np.array([
+            [0, 1, 1, 0, 0, 0],
+            [1, 0, 1, 0, 0, 0],
+            [1, 1, 0, 1, 0, 0],
+            [0, 0, 1, 0, 1, 1],
+            [0, 0, 0, 1, 0, 1],
+            [0, 0, 0, 1, 1, 0]
+        ])
+        labels = spectral_start(A, 2)
+        self.assertEqual(labels.tolist(), [0, 0, 0, 1, 1, 1])
+
+if __name__ == "__main__":
+    unittest.main()
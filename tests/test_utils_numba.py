@@ -0,0 +1,30 @@
+import unittest
+import numpy as np
+from src._utils_numba import is_symmetric
+
+class TestUtilsNumba(unittest.TestCase):
+
+    def test_symmetric_matrix(self):
+        """
+        Test that a symmetric adjacency matrix is recognized.
+        """
+        A = np.array([
+            [0, 1, 1],
+            [1, 0, 0],
+            [1, 0, 0]
+        ])
+        self.assertTrue(is_symmetric(A))
+
+    def test_non_symmetric_matrix(self):
+        """
+        Test that a non-symmetric adjacency matrix is rejected.
+        """
+        A = np.array([
+            [0, 1, 0],
+            [0, 0, 1],
+            [1, 0, 0]
+        ])
+        self.assertFalse(is_symmetric(A))
+
+if __name__ == "__main__":
+    unittest.main()